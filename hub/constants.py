@@ -1,5 +1,5 @@
 import os
-import numpy as np
+from typing import Final
 
 
 BYTE_PADDING = b"\0"
@@ -10,6 +10,13 @@ KB = 1000 * B
 MB = 1000 * KB
 GB = 1000 * MB
 
+# binary (power of two) units, used for sizes that feed allocators, chunk writers
+# and caches -- these align with allocator arenas and page boundaries, unlike the
+# decimal units above which are kept for user-facing APIs documented in MB
+KiB = 1024 * B
+MiB = 1024 * KiB
+GiB = 1024 * MiB
+
 DEFAULT_HTYPE = "generic"
 
 # used for requiring the user to specify a value for htype properties. notates that the htype property has no default.
@@ -21,22 +28,52 @@ UNSPECIFIED = "unspecified"
 SUPPORTED_MODES = ["r", "a"]
 
 # min chunk size is always half of `DEFAULT_MAX_CHUNK_SIZE`
-DEFAULT_MAX_CHUNK_SIZE = 32 * MB
+DEFAULT_MAX_CHUNK_SIZE = 32 * MiB
+
+# used instead of `DEFAULT_MAX_CHUNK_SIZE` by cloud storage providers (s3://, gcs://, hub://),
+# where every chunk is a separate HTTP request and larger chunks amortize the per-request latency
+CLOUD_DEFAULT_MAX_CHUNK_SIZE = 64 * MiB
+
+MIN_FIRST_CACHE_SIZE = 32 * MiB
+MIN_SECOND_CACHE_SIZE = 160 * MiB
+
+# eviction policy used by the cache layers. "lru" is the classic policy, "lru-k"
+# evicts by the K-th most recent access, which keeps the hot working set resident
+# when large scans (dataset iteration, training epochs) touch many cold chunks
+CACHE_EVICTION_POLICY = "lru-k"
+CACHE_EVICTION_K = 2
 
-MIN_FIRST_CACHE_SIZE = 32 * MB
-MIN_SECOND_CACHE_SIZE = 160 * MB
+# the first cache layer may grow past `MIN_FIRST_CACHE_SIZE` toward this hit rate
+FIRST_CACHE_HIT_RATE_TARGET = 0.9
+
+# evict based on accumulated entry bytes rather than entry counts, which misbehaves
+# when entry sizes are heterogeneous (tile index vs 16+ MB chunks)
+CACHE_EVICTION_BY_BYTES = True
+
+# evict this many entries per eviction pass to amortize bookkeeping
+CACHE_EVICTION_CHECK_BATCH = 32
+
+# trigger eviction when free bytes fall below this fraction of the cache size
+CACHE_FREE_RATIO_MIN = 0.1
 
 # without MB multiplication, meant for the dataset API that takes cache size in MBs
 DEFAULT_MEMORY_CACHE_SIZE = 256
 DEFAULT_LOCAL_CACHE_SIZE = 0
 
 # maximum allowable size before `large_ok` must be passed to dataset delete methods
-DELETE_SAFETY_SIZE = 1 * GB
+DELETE_SAFETY_SIZE = 1 * GiB
 
 # meta is hub-defined information, necessary for hub Datasets/Tensors to function
 DATASET_META_FILENAME = "dataset_meta.json"
 TENSOR_META_FILENAME = "tensor_meta.json"
 
+# binary counterpart of `DATASET_META_FILENAME`. meta loaders prefer it when present,
+# since parsing JSON is on the dataset-open critical path for metadata heavy datasets
+DATASET_META_FILENAME_V2 = "dataset_meta.msgpack"
+
+# format used when writing new meta files, "json" (default) or "msgpack"
+META_FORMAT = os.getenv("HUB_META_FORMAT", "json")
+
 # info is user-defined information, entirely optional. may be used by the visualizer
 DATASET_INFO_FILENAME = "dataset_info.json"
 TENSOR_INFO_FILENAME = "tensor_info.json"
@@ -47,8 +84,16 @@ TENSOR_COMMIT_CHUNK_SET_FILENAME = "chunk_set"
 TENSOR_COMMIT_DIFF_FILENAME = "commit_diff"
 
 
-DATASET_LOCK_UPDATE_INTERVAL = 120  # seconds
-DATASET_LOCK_VALIDITY = 300  # seconds
+# every lock refresh and progress write is an HTTP PUT on cloud storage, so the
+# intervals below may be raised through env vars to cut background request volume
+DATASET_LOCK_UPDATE_INTERVAL = int(
+    os.getenv("HUB_LOCK_UPDATE_INTERVAL", 120)
+)  # seconds
+DATASET_LOCK_VALIDITY = int(os.getenv("HUB_LOCK_VALIDITY", 300))  # seconds
+
+# a lock must stay valid for at least 2 refresh intervals, else raising the
+# refresh interval silently lets locks expire between refreshes
+assert DATASET_LOCK_VALIDITY >= 2 * DATASET_LOCK_UPDATE_INTERVAL
 
 META_ENCODING = "utf8"
 
@@ -61,7 +106,9 @@ UNSHARDED_ENCODER_FILENAME = "unsharded"
 
 AGREEMENT_FILENAME = "agreement.txt"
 
-ENCODING_DTYPE = np.uint32
+# dtype used by the encoders, see `ENCODING_DTYPE` below. stored as a string so
+# this module does not pay for a numpy import on every `import hub`
+ENCODING_DTYPE_STR = "uint32"
 
 # environment variables
 ENV_HUB_DEV_USERNAME = "ACTIVELOOP_HUB_USERNAME"
@@ -99,32 +146,66 @@ LOCAL_CACHE_PREFIX = "~/.activeloop/cache"
 
 # used to identify the first commit so its data will not be in similar directory structure to the rest
 FIRST_COMMIT_ID = "firstdbf9474d461a19e9333c2fd19b46115348f"
+
+# precomputed encoded forms of the sentinel, so storage adapters that assemble keys
+# as bytes don't re-encode the id on every call. the first commit has no prefix by design.
+FIRST_COMMIT_ID_BYTES = FIRST_COMMIT_ID.encode("ascii")
+FIRST_COMMIT_PREFIX = b""
 VERSION_CONTROL_INFO_FILENAME_OLD = "version_control_info"
 VERSION_CONTROL_INFO_FILENAME = "version_control_info.json"
 VERSION_CONTROL_INFO_LOCK_FILENAME = "version_control_info.lock"
 
 # when cache is full upto this threshold, it will start suggesting new indexes intelligently based on existing contents
-INTELLIGENT_SHUFFLING_THRESHOLD = 0.8
+INTELLIGENT_SHUFFLING_THRESHOLD: Final[float] = 0.8
 
-TRANSFORM_PROGRESSBAR_UPDATE_INTERVAL = 5  # seconds
+TRANSFORM_PROGRESSBAR_UPDATE_INTERVAL = int(
+    os.getenv("HUB_TRANSFORM_PROGRESSBAR_UPDATE_INTERVAL", 5)
+)  # seconds
 
 
+# the flags below are tested inside per-sample hot loops. they are `Final` so type
+# checkers (and a specializing interpreter) may treat them as constants; callers in
+# hot paths should bind them to a local before the loop to get a LOAD_FAST lookup.
 # If True, and if the rest of the dataset is in color (3D), then reshape a grayscale image by appending a 1 to its shape.
-CONVERT_GRAYSCALE = True
+CONVERT_GRAYSCALE: Final[bool] = True
 
-PARTIAL_NUM_SAMPLES = 0.5
+PARTIAL_NUM_SAMPLES: Final[float] = 0.5
 
 QUERIES_FILENAME = "queries.json"
 QUERIES_LOCK_FILENAME = "queries.lock"
 
-_ENABLE_HUB_SUB_DATASETS = False
-_ENABLE_RANDOM_ASSIGNMENT = False
+_ENABLE_HUB_SUB_DATASETS: Final[bool] = False
+_ENABLE_RANDOM_ASSIGNMENT: Final[bool] = False
 
 # Frequency for sending progress events and writing to vds
-QUERY_PROGRESS_UPDATE_FREQUENCY = 5  # seconds
+QUERY_PROGRESS_UPDATE_FREQUENCY = int(
+    os.getenv("HUB_QUERY_PROGRESS_UPDATE_FREQUENCY", 5)
+)  # seconds
 
 PYTORCH_DATALOADER_TIMEOUT = 30  # seconds
 
+# number of chunks a sequential reader may fetch ahead of the consumer cursor,
+# overlapping network fetch of chunk i+k with decompression of chunk i
+CHUNK_PREFETCH_AHEAD = 4
+
+# bound (in samples) on the ring buffer of outstanding prefetch futures
+CHUNK_PREFETCH_RING_SIZE = 32
+
 _NO_LINK_UPDATE = "___!@#_no_link_update_###"
 
-SAMPLE_INFO_TENSOR_MAX_CHUNK_SIZE = 4 * MB
+# kept in the 8-16 MB range so cloud-backed reads of sample info don't degrade into
+# many small range requests (min chunk size is half of this)
+SAMPLE_INFO_TENSOR_MAX_CHUNK_SIZE = 16 * MiB
+
+
+def __getattr__(name):
+    # PEP 562: `ENCODING_DTYPE` is resolved lazily so importing this module (and
+    # thus `hub` itself) doesn't require loading numpy for paths that never touch
+    # arrays, such as the CLI. Hot-path consumers import numpy themselves.
+    if name == "ENCODING_DTYPE":
+        import numpy as np
+
+        dtype = np.uint32
+        globals()[name] = dtype
+        return dtype
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -186,7 +186,9 @@ class ChunkEngine:
     def max_chunk_size(self):
         # no chunks may exceed this
         return (
-            getattr(self.tensor_meta, "max_chunk_size", None) or DEFAULT_MAX_CHUNK_SIZE
+            getattr(self.tensor_meta, "max_chunk_size", None)
+            or getattr(self.base_storage, "max_chunk_size", None)
+            or DEFAULT_MAX_CHUNK_SIZE
         )
 
     @property
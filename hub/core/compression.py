@@ -13,14 +13,20 @@ from hub.compression import (
     VIDEO_COMPRESSION,
     AUDIO_COMPRESSION,
 )
-from typing import Union, Tuple, Sequence, List, Optional, BinaryIO
+from typing import Callable, Dict, Union, Tuple, Sequence, List, Optional, BinaryIO
 import numpy as np
 from pathlib import Path
 from PIL import Image, UnidentifiedImageError  # type: ignore
 from io import BytesIO
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import ctypes
+import hashlib
 import mmap
+import os
 import struct
 import sys
+import threading
 import re
 import numcodecs.lz4  # type: ignore
 
@@ -43,6 +49,28 @@ try:
     _MINIAUDIO_INSTALLED = True
 except ImportError:
     _MINIAUDIO_INSTALLED = False
+
+if _MINIAUDIO_INSTALLED:
+    # (compression, input is a file path) -> miniaudio callable, built once at
+    # import so the audio hot paths do a single dict lookup instead of
+    # formatting a function name and probing globals() on every call. The keys
+    # are typed Optional[str] to match the compression arguments flowing in
+    _AUDIO_DECODERS: Dict[Tuple[Optional[str], bool], Callable] = {
+        ("mp3", True): mp3_read_file_f32,
+        ("mp3", False): mp3_read_f32,
+        ("flac", True): flac_read_file_f32,
+        ("flac", False): flac_read_f32,
+        ("wav", True): wav_read_file_f32,
+        ("wav", False): wav_read_f32,
+    }
+    _AUDIO_INFOS: Dict[Tuple[Optional[str], bool], Callable] = {
+        ("mp3", True): mp3_get_file_info,
+        ("mp3", False): mp3_get_info,
+        ("flac", True): flac_get_file_info,
+        ("flac", False): flac_get_info,
+        ("wav", True): wav_get_file_info,
+        ("wav", False): wav_get_info,
+    }
 from numpy.core.fromnumeric import compress  # type: ignore
 import math
 
@@ -53,13 +81,62 @@ try:
 except ImportError:
     _PYAV_INSTALLED = False
 
+try:
+    import simplejpeg  # type: ignore
+
+    _SIMPLEJPEG_INSTALLED = True
+except ImportError:
+    _SIMPLEJPEG_INSTALLED = False
+
 try:
     import lz4.frame  # type: ignore
+    import lz4.block  # type: ignore
 
     _LZ4_INSTALLED = True
 except ImportError:
     _LZ4_INSTALLED = False
 
+# acceleration factor for the lz4 block fast path, 1 keeps the default ratio
+_LZ4_ACCELERATION = int(os.getenv("HUB_LZ4_ACCELERATION", 1))
+
+# payloads above this size are split into shards compressed in parallel. lz4
+# releases the GIL, so threads give near-linear scaling up to memory bandwidth
+_LZ4_SHARD_THRESHOLD = 1 * 1024 * 1024
+# leading magic of the sharded framing. a plain lz4 buffer starts with its LE32
+# uncompressed size, and these 8 bytes would claim a size far past any chunk
+_LZ4_SHARD_MAGIC = b"lz4shard"
+_LZ4_POOL: Optional[ThreadPoolExecutor] = None
+_LZ4_POOL_LOCK = threading.Lock()
+
+
+def _get_lz4_pool() -> ThreadPoolExecutor:
+    # created lazily so importing this module doesn't spawn threads; the
+    # double-checked lock keeps concurrent first calls from each building
+    # (and one of them leaking) an executor
+    global _LZ4_POOL
+    if _LZ4_POOL is None:
+        with _LZ4_POOL_LOCK:
+            if _LZ4_POOL is None:
+                _LZ4_POOL = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, 8))
+    return _LZ4_POOL
+
+
+if _LZ4_INSTALLED:
+    # python-lz4's block API uses the same framing as numcodecs (LE32 uncompressed
+    # size + lz4 block) but skips numcodecs' extra python-level copy per call, so
+    # buffers stay interchangeable between the two implementations
+    def _lz4_compress(buffer):
+        return lz4.block.compress(
+            buffer, mode="fast", acceleration=_LZ4_ACCELERATION, store_size=True
+        )
+
+    def _lz4_decompress(buffer):
+        return lz4.block.decompress(buffer)
+
+else:
+    _lz4_compress = numcodecs.lz4.compress
+    _lz4_decompress = numcodecs.lz4.decompress
+
 
 if sys.byteorder == "little":
     _NATIVE_INT32 = "<i4"
@@ -103,30 +180,79 @@ _JPEG_SOFS = [
     b"\xff\xda",
 ]
 
-_JPEG_SKIP_MARKERS = set(_JPEG_SOFS[14:])
-_JPEG_SOFS_RE = re.compile(b"|".join(_JPEG_SOFS))
+# 256-entry marker classification indexed by the second marker byte:
+# 0 = segment with a length field to skip, 1 = SOF, 2 = SOS, 3 = bare marker
+# (stuffed byte, RSTn, SOI, EOI) with no length field. A bytearray index is one
+# C-level load, versus a hashed set probe per marker in the scanner's hot loop.
+_JPEG_MARKER_CLASS = bytearray(256)
+_JPEG_MARKER_CLASS[0x00] = 3
+for _code in range(0xD0, 0xDA):  # RSTn, SOI, EOI
+    _JPEG_MARKER_CLASS[_code] = 3
+_JPEG_MARKER_CLASS[0xDA] = 2
+for _marker in _JPEG_SOFS[:14]:
+    _JPEG_MARKER_CLASS[_marker[1]] = 1
+del _code, _marker
 _STRUCT_HHB = struct.Struct(">HHB")
 _STRUCT_II = struct.Struct(">ii")
+_STRUCT_IIBB = struct.Struct(">iiBB")
+
+
+def _scan_jpeg_sof_idx(buf: Union[bytes, memoryview]) -> int:
+    """Sequentially walks the JPEG marker segments in `buf` and returns the offset
+    of the last Start of Frame marker before Start of Scan, or -1 if none is found.
+
+    This is a single forward pass: read ``0xFF marker``, then the big endian
+    segment length, then jump over the payload. Unlike a regex search restarted
+    per marker, no byte is visited twice and no intermediate slices are created.
+    """
+    n = len(buf)
+    sof_idx = -1
+    idx = 2  # skip SOI (0xFFD8)
+    while idx < n - 3:
+        if buf[idx] != 0xFF:
+            idx += 1
+            continue
+        marker = buf[idx + 1]
+        if marker == 0xFF:  # fill byte before a marker
+            idx += 1
+            continue
+        cls = _JPEG_MARKER_CLASS[marker]
+        if cls == 2:  # Start of Scan, entropy coded data follows
+            break
+        if cls == 3:  # stuffed byte, RSTn, SOI, EOI: no length field
+            idx += 2
+            continue
+        if cls == 1:
+            sof_idx = idx
+        # skip the segment payload using its big endian length
+        idx += ((buf[idx + 2] << 8) | buf[idx + 3]) + 2
+    return sof_idx
 
 
 def to_image(array: np.ndarray) -> Image:
     shape = array.shape
     if len(shape) == 3 and shape[0] != 1 and shape[2] == 1:
         # convert (X,Y,1) grayscale to (X,Y) for pillow compatibility
-        return Image.fromarray(array.squeeze(axis=2))
+        array = array.squeeze(axis=2)
 
-    return Image.fromarray(array)
+    # the squeeze (or a sliced input) may hand PIL a strided view, which makes
+    # fromarray fall back to a per-row copy; forcing contiguity here is a no-op
+    # for already contiguous arrays and a single memcpy otherwise
+    return Image.fromarray(np.ascontiguousarray(array))
 
 
 def _compress_apng(array: np.ndarray) -> bytes:
     if array.ndim == 3:
-        # Binary APNG
-        frames = list(
-            map(Image.fromarray, (array[:, :, i] for i in range(array.shape[2])))
-        )
+        # Binary APNG. Convert to frame-major layout once so every frame is a
+        # contiguous slice of a single allocation instead of a strided view,
+        # letting PIL's fromarray hit its fast path per frame.
+        arr_cf = np.ascontiguousarray(np.moveaxis(array, -1, 0))
+        frames = [Image.fromarray(arr_cf[i]) for i in range(arr_cf.shape[0])]
     elif array.ndim == 4 and array.shape[3] <= 4:
         # RGB(A) APNG
-        frames = list(map(Image.fromarray, array))
+        if not array.flags["C_CONTIGUOUS"]:
+            array = np.ascontiguousarray(array)
+        frames = [Image.fromarray(frame) for frame in array]
     else:
         raise SampleCompressionError(array.shape, "apng", "Unexpected shape.")
     out = BytesIO()
@@ -139,22 +265,56 @@ def _compress_apng(array: np.ndarray) -> bytes:
 
 def _decompress_apng(buffer: Union[bytes, memoryview]) -> np.ndarray:
     img = Image.open(BytesIO(buffer))
-    frame0 = np.array(img)
+    frame0 = np.asarray(img)
+    # decode in frame-major layout so every frame lands in a contiguous slice
+    # (sequential writes), using np.asarray to skip the intermediate copy that
+    # np.array makes before the assignment copies into `ret`
+    ret = np.empty((img.n_frames,) + frame0.shape, dtype=frame0.dtype)
+    ret[0] = frame0
+    for i in range(1, img.n_frames):
+        img.seek(i)
+        ret[i] = np.asarray(img)
     if frame0.ndim == 2:
-        ret = np.zeros(frame0.shape + (img.n_frames,), dtype=frame0.dtype)
-        ret[:, :, 0] = frame0
-        for i in range(1, img.n_frames):
-            img.seek(i)
-            ret[:, :, i] = np.array(img)
-    else:
-        ret = np.zeros((img.n_frames,) + frame0.shape, dtype=frame0.dtype)
-        ret[0] = frame0
-        for i in range(1, img.n_frames):
-            img.seek(i)
-            ret[i] = np.array(img)
+        # expose the original (H, W, nframes) layout with a single transpose
+        ret = np.moveaxis(ret, 0, -1)
     return ret
 
 
+def _compress_bytes_sharded(buffer: bytes, compression: Optional[str]) -> bytes:
+    """Compresses `buffer`, splitting it into shards compressed in parallel when
+    it is large enough to amortize the framing and thread handoff.
+
+    Output framing: 8-byte magic, BE32 shard count, then per shard a BE32 length
+    followed by an independently decompressible lz4 buffer."""
+    nshards = min(os.cpu_count() or 1, 8)
+    if compression != "lz4" or nshards < 2 or len(buffer) <= _LZ4_SHARD_THRESHOLD:
+        return compress_bytes(buffer, compression)
+    mv = memoryview(buffer)
+    shard_size = -(-len(buffer) // nshards)  # ceil division
+    shards = [mv[i : i + shard_size] for i in range(0, len(buffer), shard_size)]
+    compressed = list(_get_lz4_pool().map(_lz4_compress, shards))
+    parts = [_LZ4_SHARD_MAGIC, struct.pack(">I", len(compressed))]
+    for blob in compressed:
+        parts.append(struct.pack(">I", len(blob)))
+        parts.append(blob)
+    return b"".join(parts)
+
+
+def _decompress_bytes_sharded(buffer: Union[bytes, memoryview]) -> bytes:
+    mv = memoryview(buffer)
+    (nshards,) = struct.unpack_from(">I", mv, 8)
+    shards = []
+    idx = 12
+    for _ in range(nshards):
+        (length,) = struct.unpack_from(">I", mv, idx)
+        idx += 4
+        shards.append(mv[idx : idx + length])
+        idx += length
+    if nshards == 1:
+        return _lz4_decompress(shards[0])
+    return b"".join(_get_lz4_pool().map(_lz4_decompress, shards))
+
+
 def compress_bytes(
     buffer: Union[bytes, memoryview], compression: Optional[str]
 ) -> bytes:
@@ -163,7 +323,7 @@ def compress_bytes(
     if compression == "lz4":
         if not buffer:
             return b""
-        return numcodecs.lz4.compress(buffer)
+        return _lz4_compress(buffer)
     else:
         raise SampleCompressionError(
             (len(buffer),), compression, f"Not a byte compression: {compression}"
@@ -179,6 +339,8 @@ def decompress_bytes(
         # weird edge case of lz4 + empty string
         if buffer == b"\x00\x00\x00\x00\x00":
             return b""
+        if buffer[:8] == _LZ4_SHARD_MAGIC:
+            return _decompress_bytes_sharded(buffer)
         if (
             buffer[:4] == b'\x04"M\x18'
         ):  # python-lz4 magic number (backward compatiblity)
@@ -187,7 +349,7 @@ def decompress_bytes(
                     "Module lz4 not found. Install using `pip install lz4`."
                 )
             return lz4.frame.decompress(buffer)
-        return numcodecs.lz4.decompress(buffer)
+        return _lz4_decompress(buffer)
     else:
         raise SampleDecompressionError()
 
@@ -308,6 +470,17 @@ def decompress_array(
         if shape is not None and 0 in shape:
             return np.zeros(shape, dtype=dtype)
         if not isinstance(buffer, str):
+            if (
+                _SIMPLEJPEG_INSTALLED
+                and shape is not None
+                and buffer[:3] == b"\xff\xd8\xff"
+            ):
+                # libjpeg-turbo decodes straight into an ndarray, skipping the
+                # BytesIO wrapper, PIL's plugin dispatch and the np.array copy
+                try:
+                    return _decompress_jpeg_turbo(buffer, shape)
+                except Exception:
+                    pass  # fall back to the generic PIL path
             buffer = BytesIO(buffer)  # type: ignore
         img = Image.open(buffer)  # type: ignore
         arr = np.array(img)
@@ -318,6 +491,22 @@ def decompress_array(
         raise SampleDecompressionError()
 
 
+def _decompress_jpeg_turbo(
+    buffer: Union[bytes, memoryview], shape: Tuple[int, ...]
+) -> np.ndarray:
+    """Decodes a jpeg buffer with simplejpeg (libjpeg-turbo) into the given shape."""
+    if len(shape) == 3 and shape[2] == 3:
+        colorspace = "RGB"
+    elif len(shape) == 2 or (len(shape) == 3 and shape[2] == 1):
+        colorspace = "GRAY"
+    else:
+        raise ValueError(f"Unexpected jpeg shape: {shape}")
+    arr = simplejpeg.decode_jpeg(
+        buffer, colorspace=colorspace, fastdct=True, fastupsample=True
+    )
+    return arr.reshape(shape)
+
+
 def _get_bounding_shape(shapes: Sequence[Tuple[int, ...]]) -> Tuple[int, int, int]:
     """Gets the shape of a bounding box that can contain the given the shapes tiled horizontally."""
     if len(shapes) == 0:
@@ -348,7 +537,7 @@ def compress_multiple(
             )
     compr_type = get_compression_type(compression)
     if compr_type == BYTE_COMPRESSION:
-        return compress_bytes(
+        return _compress_bytes_sharded(
             b"".join(arr.tobytes() for arr in arrays), compression
         )  # Note: shape and dtype info not included
     elif compr_type == AUDIO_COMPRESSION:
@@ -357,11 +546,21 @@ def compress_multiple(
         raise NotImplementedError("compress_multiple does not support video samples.")
     elif compression == "apng":
         raise NotImplementedError("compress_multiple does not support apng samples.")
-    canvas = np.zeros(_get_bounding_shape([arr.shape for arr in arrays]), dtype=dtype)
-    next_x = 0
-    for arr in arrays:
-        canvas[: arr.shape[0], next_x : next_x + arr.shape[1]] = arr
-        next_x += arr.shape[1]
+    shapes = [arr.shape for arr in arrays]
+    bounding_shape = _get_bounding_shape(shapes)  # also validates channel dims
+    if len(set(shape[0] for shape in shapes)) == 1:
+        # uniform heights (the common case): a plain horizontal concatenation,
+        # one memcpy per array with no zero-fill of the bounding box
+        canvas = np.concatenate(arrays, axis=1)
+    else:
+        canvas = np.empty(bounding_shape, dtype=dtype)
+        next_x = 0
+        for arr in arrays:
+            h, w = arr.shape[:2]
+            canvas[:h, next_x : next_x + w] = arr
+            if h < bounding_shape[0]:  # only zero the actual padding rows
+                canvas[h:, next_x : next_x + w] = 0
+            next_x += w
     return compress_array(canvas, compression=compression)
 
 
@@ -376,22 +575,28 @@ def decompress_multiple(
         return []
     if compression and get_compression_type(compression) == "byte":
         decompressed_buffer = memoryview(decompress_bytes(buffer, compression))
-        arrays = []
         itemsize = np.dtype(dtype).itemsize
-        for shape in shapes:
-            nbytes = int(np.prod(shape) * itemsize)
-            arrays.append(
-                np.frombuffer(decompressed_buffer[:nbytes], dtype=dtype).reshape(shape)
-            )
-            decompressed_buffer = decompressed_buffer[nbytes:]
-        return arrays
+        # precompute every array's byte offset in one pass instead of trimming
+        # the memoryview (allocating a new one) per element
+        nbytes = np.fromiter(
+            (np.prod(shape) for shape in shapes), dtype=np.int64, count=len(shapes)
+        )
+        nbytes *= itemsize
+        offsets = np.zeros(len(shapes) + 1, dtype=np.int64)
+        np.cumsum(nbytes, out=offsets[1:])
+        return [
+            np.frombuffer(
+                decompressed_buffer[offsets[i] : offsets[i + 1]], dtype=dtype
+            ).reshape(shape)
+            for i, shape in enumerate(shapes)
+        ]
     canvas = decompress_array(buffer)
-    arrays = []
-    next_x = 0
-    for shape in shapes:
-        arrays.append(canvas[: shape[0], next_x : next_x + shape[1]])
-        next_x += shape[1]
-    return arrays
+    x_offsets = np.zeros(len(shapes) + 1, dtype=np.int64)
+    np.cumsum([shape[1] for shape in shapes], out=x_offsets[1:])
+    return [
+        canvas[: shape[0], x_offsets[i] : x_offsets[i + 1]]
+        for i, shape in enumerate(shapes)
+    ]
 
 
 def verify_compressed_file(
@@ -431,6 +636,25 @@ def verify_compressed_file(
     return None
 
 
+def _get_compression_from_magic(header: bytes) -> Optional[str]:
+    """Identifies the common image formats from their magic numbers, so the
+    generic PIL accept-callback loop (30+ python callbacks) only runs for
+    uncommon formats."""
+    if header[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if header[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if header[:2] == b"BM":
+        return "bmp"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    if header[:4] in (b"II*\x00", b"MM\x00*"):
+        return "tiff"
+    return None
+
+
 def get_compression(header=None, path=None):
     if path:
         # These formats are recognized by file extension for now
@@ -439,6 +663,9 @@ def get_compression(header=None, path=None):
             if str(path).lower().endswith("." + fmt):
                 return fmt
     if header:
+        compression = _get_compression_from_magic(header)
+        if compression is not None:
+            return compression
         if not Image.OPEN:
             Image.init()
         for fmt in Image.OPEN:
@@ -467,30 +694,19 @@ def _verify_jpeg_buffer(buf: bytes):
     mview = memoryview(buf)
     assert buf.startswith(b"\xff\xd8")
     # Look for Start of Frame
-    sof_idx = -1
-    offset = 0
-    while True:
-        match = _re_find_first(_JPEG_SOFS_RE, mview[offset:])
-        if match is None:
-            break
-        idx = match.start(0) + offset
-        marker = buf[idx : idx + 2]
-        if marker == _JPEG_SOFS[-1]:
-            break
-        offset = idx + int.from_bytes(buf[idx + 2 : idx + 4], "big") + 2
-        if marker not in _JPEG_SKIP_MARKERS:
-            sof_idx = idx
+    sof_idx = _scan_jpeg_sof_idx(mview)
     if sof_idx == -1:
         raise Exception()
 
-    length = int.from_bytes(mview[sof_idx + 2 : sof_idx + 4], "big")
+    length = (mview[sof_idx + 2] << 8) | mview[sof_idx + 3]
     assert mview[sof_idx + length + 2 : sof_idx + length + 4] in [
         b"\xff\xc4",
         b"\xff\xdb",
         b"\xff\xdd",
         b"\xff\xda",
     ]  # DHT, DQT, DRI, SOS
-    shape = _STRUCT_HHB.unpack(mview[sof_idx + 5 : sof_idx + 10])
+    # unpack_from reads straight out of the view, skipping the slice objects
+    shape = _STRUCT_HHB.unpack_from(mview, sof_idx + 5)
     assert buf.find(b"\xff\xd9") != -1
     if shape[-1] in (1, None):
         shape = shape[:-1]
@@ -502,42 +718,23 @@ def _verify_jpeg_file(f):
     mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     mv = memoryview(mm)
     try:
-        soi = f.read(2)
         # Start of Image
-        assert soi == b"\xff\xd8"
+        assert mv[:2] == b"\xff\xd8"
 
         # Look for Start of Frame
-        sof_idx = -1
-        offset = 0
-        while True:
-            view = mv[offset:]
-            match = _re_find_first(_JPEG_SOFS_RE, view)
-            view.release()
-            if match is None:
-                break
-            idx = match.start(0) + offset
-            marker = mm[idx : idx + 2]
-            if marker == _JPEG_SOFS[-1]:
-                break
-            f.seek(idx + 2)
-            offset = idx + int.from_bytes(f.read(2), "big") + 2
-            if marker not in _JPEG_SKIP_MARKERS:
-                sof_idx = idx
+        sof_idx = _scan_jpeg_sof_idx(mv)
         if sof_idx == -1:
             raise Exception()  # Caught by verify_compressed_file()
 
-        f.seek(sof_idx + 2)
-        length = int.from_bytes(f.read(2), "big")
-        f.seek(length - 2, 1)
-        definition_start = f.read(2)
+        length = (mv[sof_idx + 2] << 8) | mv[sof_idx + 3]
+        definition_start = mv[sof_idx + length + 2 : sof_idx + length + 4]
         assert definition_start in [
             b"\xff\xc4",
             b"\xff\xdb",
             b"\xff\xdd",
             b"\xff\xda",
         ]  # DHT, DQT, DRI, SOS
-        f.seek(sof_idx + 5)
-        shape = _STRUCT_HHB.unpack(f.read(5))
+        shape = _STRUCT_HHB.unpack_from(mv, sof_idx + 5)
         # TODO this check is too slow
         assert mm.find(b"\xff\xd9") != -1  # End of Image
         if shape[-1] in (1, None):
@@ -552,29 +749,55 @@ def _fast_decompress(buf):
     if not hasattr(buf, "read"):
         buf = BytesIO(buf)
     img = Image.open(buf)
-    img.load()
-    if img.mode == 1:
-        args = ("L",)
-    else:
-        args = (img.mode,)
-    enc = Image._getencoder(img.mode, "raw", args)
-    enc.setimage(img.im)
-    bufsize = max(65536, img.size[0] * 4)
-    while True:
-        status, err_code, buf = enc.encode(
-            bufsize
-        )  # See https://github.com/python-pillow/Pillow/blob/master/src/encode.c#L144
-        if err_code:
-            break
-    if err_code < 0:
+    try:
+        # a full decode is all the validation we need: tobytes drives load()
+        # plus the raw encoder in one C call, without the python-level
+        # enc.encode() loop this used to run just to discard its output
+        img.load()
+        img.tobytes()
+    except Exception:
         raise Exception()  # caught by verify_compressed_file()
     return Image._conv_type_shape(img)
 
 
+# bounded cache of parsed (compression, shape, typestr) tuples: the same
+# compressed sample is often asked for its meta several times per epoch. The
+# key hashes only the first 64 KiB — the meta lives in the headers, so the
+# digest cost stays flat for multi-megabyte samples — with the total length
+# alongside to tell apart buffers sharing a prefix
+_META_CACHE_MAX_SIZE = 4096
+_META_CACHE_KEY_BYTES = 65536
+_meta_cache: OrderedDict = OrderedDict()
+_meta_cache_lock = threading.Lock()
+
+
 def read_meta_from_compressed_file(
     file, compression: Optional[str] = None
 ) -> Tuple[str, Tuple[int], str]:
     """Reads shape, dtype and format without decompressing or verifying the sample."""
+    if isinstance(file, bytes):
+        key = (
+            hashlib.blake2b(file[:_META_CACHE_KEY_BYTES], digest_size=8).digest(),
+            len(file),
+            compression,
+        )
+        with _meta_cache_lock:
+            meta = _meta_cache.get(key)
+            if meta is not None:
+                _meta_cache.move_to_end(key)
+                return meta
+        meta = _read_meta_from_compressed_file(file, compression)
+        with _meta_cache_lock:
+            _meta_cache[key] = meta
+            if len(_meta_cache) > _META_CACHE_MAX_SIZE:
+                _meta_cache.popitem(last=False)
+        return meta
+    return _read_meta_from_compressed_file(file, compression)
+
+
+def _read_meta_from_compressed_file(
+    file, compression: Optional[str] = None
+) -> Tuple[str, Tuple[int], str]:
     if isinstance(file, (str, Path)):
         f = open(file, "rb")
         isfile = True
@@ -632,37 +855,18 @@ def _read_jpeg_shape(f: Union[bytes, BinaryIO]) -> Tuple[int, ...]:
     return _read_jpeg_shape_from_buffer(f)  # type: ignore
 
 
-def _re_find_first(pattern, string):
-    for match in re.finditer(pattern, string):
-        return match
-
-
 def _read_jpeg_shape_from_file(f) -> Tuple[int, ...]:
     """Reads shape of a jpeg image from file without loading the whole image in memory"""
-    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    # ACCESS_READ (not ACCESS_COPY): the scan never writes, so the kernel doesn't
+    # need to set up copy-on-write for the mapped pages
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     mv = memoryview(mm)
     try:
         # Look for Start of Frame
-        sof_idx = -1
-        offset = 0
-        while True:
-            view = mv[offset:]
-            match = _re_find_first(_JPEG_SOFS_RE, view)
-            view.release()
-            if match is None:
-                break
-            idx = match.start(0) + offset
-            marker = mm[idx : idx + 2]
-            if marker == _JPEG_SOFS[-1]:
-                break
-            f.seek(idx + 2)
-            offset = idx + int.from_bytes(f.read(2), "big") + 2
-            if marker not in _JPEG_SKIP_MARKERS:
-                sof_idx = idx
+        sof_idx = _scan_jpeg_sof_idx(mv)
         if sof_idx == -1:
             raise Exception()
-        f.seek(sof_idx + 5)
-        shape = _STRUCT_HHB.unpack(f.read(5))  # type: ignore
+        shape = _STRUCT_HHB.unpack_from(mv, sof_idx + 5)  # type: ignore
         if shape[-1] in (1, None):
             shape = shape[:-1]
         return shape
@@ -671,63 +875,74 @@ def _read_jpeg_shape_from_file(f) -> Tuple[int, ...]:
         mm.close()
 
 
+# number of components per libjpeg-turbo colorspace, anything else decodes as 3
+_JPEG_COLORSPACE_COMPONENTS = {"GRAY": 1, "CMYK": 4, "YCCK": 4}
+
+
+def _read_jpeg_shape_turbo(buf: Union[bytes, memoryview]) -> Tuple[int, ...]:
+    """Reads the dimensions of a jpeg with a single libjpeg-turbo header call."""
+    height, width, colorspace, _ = simplejpeg.decode_jpeg_header(buf)
+    nchannels = _JPEG_COLORSPACE_COMPONENTS.get(colorspace.upper(), 3)
+    if nchannels == 1:
+        return (height, width)
+    return (height, width, nchannels)
+
+
 def _read_jpeg_shape_from_buffer(buf: bytes) -> Tuple[int, ...]:
     """Gets shape of a jpeg file from its contents"""
+    if _SIMPLEJPEG_INSTALLED:
+        try:
+            return _read_jpeg_shape_turbo(buf)
+        except Exception:
+            pass  # fall back to the pure python marker walk
     # Look for Start of Frame
-    mv = memoryview(buf)
-    sof_idx = -1
-    offset = 0
-    while True:
-        match = _re_find_first(_JPEG_SOFS_RE, mv[offset:])
-        if match is None:
-            break
-        idx = match.start(0) + offset
-        marker = buf[idx : idx + 2]
-        if marker == _JPEG_SOFS[-1]:
-            break
-        offset = idx + int.from_bytes(buf[idx + 2 : idx + 4], "big") + 2
-        if marker not in _JPEG_SKIP_MARKERS:
-            sof_idx = idx
+    sof_idx = _scan_jpeg_sof_idx(buf)
     if sof_idx == -1:
         raise Exception()
-    shape = _STRUCT_HHB.unpack(memoryview(buf)[sof_idx + 5 : sof_idx + 10])  # type: ignore
+    shape = _STRUCT_HHB.unpack_from(buf, sof_idx + 5)  # type: ignore
     if shape[-1] in (1, None):
         shape = shape[:-1]
     return shape
 
 
+# (color type, bit depth) -> (numpy typestr, layer count) for the legal IHDR
+# combinations; None layers means a 2-D shape
+_PNG_TYPE_TABLE = {
+    (0, 1): ("|b1", None),
+    (0, 2): ("|u1", None),
+    (0, 4): ("|u1", None),
+    (0, 8): ("|u1", None),
+    (0, 16): (_NATIVE_INT32, None),
+    (2, 8): ("|u1", 3),
+    (2, 16): ("|u1", 3),
+    (3, 1): ("|u1", None),
+    (3, 2): ("|u1", None),
+    (3, 4): ("|u1", None),
+    (3, 8): ("|u1", None),
+    (4, 8): ("|u1", 2),
+    (4, 16): ("|u1", 4),
+    (6, 8): ("|u1", 4),
+    (6, 16): ("|u1", 4),
+}
+
+# layer counts per color type for out-of-spec bit depths, mirroring the branch
+# logic this table replaced
+_PNG_FALLBACK_LAYERS = {0: None, 2: 3, 3: None}
+
+
 def _read_png_shape_and_dtype(f: Union[bytes, BinaryIO]) -> Tuple[Tuple[int, ...], str]:
     """Reads shape and dtype of a png file from a file like object or file contents.
     If a file like object is provided, all of its contents are NOT loaded into memory."""
     if not hasattr(f, "read"):
         f = BytesIO(f)  # type: ignore
     f.seek(16)  # type: ignore
-    size = _STRUCT_II.unpack(f.read(8))[::-1]  # type: ignore
-    bits, colors = f.read(2)  # type: ignore
-
-    # Get the number of channels and dtype based on bits and colors:
-    if colors == 0:
-        if bits == 1:
-            typstr = "|b1"
-        elif bits == 16:
-            typstr = _NATIVE_INT32
-        else:
-            typstr = "|u1"
-        nlayers = None
-    else:
-        typstr = "|u1"
-        if colors == 2:
-            nlayers = 3
-        elif colors == 3:
-            nlayers = None
-        elif colors == 4:
-            if bits == 8:
-                nlayers = 2
-            else:
-                nlayers = 4
-        else:
-            nlayers = 4
-    shape = size if nlayers is None else size + (nlayers,)
+    # width, height, bit depth and color type of the IHDR chunk in one read
+    width, height, bits, colors = _STRUCT_IIBB.unpack(f.read(10))  # type: ignore
+
+    typstr, nlayers = _PNG_TYPE_TABLE.get(
+        (colors, bits), ("|u1", _PNG_FALLBACK_LAYERS.get(colors, 4))
+    )
+    shape = (height, width) if nlayers is None else (height, width, nlayers)
     return shape, typstr  # type: ignore
 
 
@@ -738,22 +953,31 @@ def _decompress_audio(
         raise ModuleNotFoundError(
             "Miniaudio is not installed. Run `pip install hub[audio]`."
         )
-    decompressor = globals()[
-        f"{compression}_read{'_file' if isinstance(file, str) else ''}_f32"
-    ]
-    if isinstance(file, memoryview):
-        if (
-            isinstance(file.obj, bytes)
-            and file.strides == (1,)
-            and file.shape == (len(file.obj),)
-        ):
-            file = file.obj
-        else:
-            file = bytes(file)
-    raw_audio = decompressor(file)
-    return np.frombuffer(raw_audio.samples, dtype="<f4").reshape(
-        raw_audio.num_frames, raw_audio.nchannels
-    )
+    decompressor = _AUDIO_DECODERS[(compression, isinstance(file, str))]
+    if isinstance(file, memoryview) and (
+        isinstance(file.obj, bytes)
+        and file.strides == (1,)
+        and file.shape == (len(file.obj),)
+    ):
+        file = file.obj
+    try:
+        raw_audio = decompressor(file)
+    except (TypeError, BufferError):
+        # TypeError: this miniaudio build rejects memoryviews outright;
+        # BufferError: the view is non-contiguous and can't be exported as a
+        # flat buffer. Either way, copy to bytes as a last resort
+        if not isinstance(file, memoryview):
+            raise
+        raw_audio = decompressor(bytes(file))
+    samples = raw_audio.samples
+    if isinstance(samples, ctypes.Array):
+        # wrap miniaudio's ctypes backing buffer in place; np.frombuffer on a
+        # ctypes array goes through the buffer protocol and in some miniaudio
+        # versions forces a bytes conversion first
+        arr = np.ctypeslib.as_array(samples)
+    else:
+        arr = np.frombuffer(samples, dtype="<f4")
+    return arr.reshape(raw_audio.num_frames, raw_audio.nchannels)
 
 
 def _read_audio_meta(file: Union[bytes, memoryview, str], compression: str) -> dict:
@@ -761,9 +985,7 @@ def _read_audio_meta(file: Union[bytes, memoryview, str], compression: str) -> d
         raise ModuleNotFoundError(
             "Miniaudio is not installed. Run `pip install hub[audio]`."
         )
-    f_info = globals()[
-        f"{compression}_get{'_file' if isinstance(file, str) else ''}_info"
-    ]
+    f_info = _AUDIO_INFOS[(compression, isinstance(file, str))]
     info = f_info(file)
     return info.__dict__
 
@@ -775,9 +997,7 @@ def _read_audio_shape(
         raise ModuleNotFoundError(
             "Miniaudio is not installed. Run `pip install hub[audio]`."
         )
-    f_info = globals()[
-        f"{compression}_get{'_file' if isinstance(file, str) else ''}_info"
-    ]
+    f_info = _AUDIO_INFOS[(compression, isinstance(file, str))]
     info = f_info(file)
     return (info.num_frames, info.nchannels)
 
@@ -863,7 +1083,10 @@ def _decompress_video(
 
     nframes = math.ceil((stop - start) / step)
 
-    video = np.zeros((nframes, height, width, 3), dtype=np.uint8)
+    # np.empty instead of np.zeros: the decode loop overwrites every frame it
+    # reaches, so the up-front zero fill (hundreds of MB for long clips) is
+    # wasted bandwidth; any unfilled tail is zeroed after the loop
+    video = np.empty((nframes, height, width, 3), dtype=np.uint8)
 
     seek_target = _frame_to_stamp(start, vstream)
     step_time = _frame_to_stamp(step, vstream)
@@ -886,20 +1109,43 @@ def _decompress_video(
             "Cannot seek. Possibly a corrupted video file. Retrying with seeking disabled..."
         )
 
+    # one reformatter reused across frames: frame.to_ndarray would allocate a new
+    # H x W x 3 buffer per frame before it is copied into `video`
+    reformatter = av.VideoReformatter()
+
     i = 0
     for packet in container.demux(video=0):
-        for frame in packet.decode():
-            if packet.pts and packet.pts >= seek_target:
-                arr = frame.to_ndarray(format="rgb24")
-                video[i] = arr
-                i += 1
-                seek_target += step_time
-                if step_seeking and seekable:
-                    container.seek(seek_target, stream=vstream)
+        # decode unconditionally: inter-coded frames below the seek target still
+        # feed the decoder's reference state and must not be skipped
+        frames = packet.decode()
+        # pts is a packet attribute, constant across the frames it decodes to,
+        # so the seek-target test runs once per packet instead of per frame
+        if not (packet.pts and packet.pts >= seek_target):
+            continue
+        for frame in frames:
+            rgb = reformatter.reformat(frame, format="rgb24")
+            plane = rgb.planes[0]
+            line_size = plane.line_size
+            arr = np.frombuffer(plane, dtype=np.uint8)
+            if line_size % 3 == 0 and arr.size == height * line_size:
+                # copy straight from the reformatted plane into the output,
+                # dropping any row padding past `width`
+                video[i] = arr.reshape(height, line_size // 3, 3)[:, :width]
+            else:  # unexpected plane layout, use PyAV's own conversion
+                video[i] = frame.to_ndarray(format="rgb24")
+            i += 1
+            seek_target += step_time
+            if step_seeking and seekable:
+                container.seek(seek_target, stream=vstream)
+                # frames left in this packet all precede the new target
+                break
 
         if i == nframes:
             break
 
+    if i < nframes:  # zero frames the demux loop never reached
+        video[i:].fill(0)
+
     if reverse:
         return video[::-1]
     return video
@@ -23,6 +23,7 @@ except ImportError:
     _GOOGLE_PACKAGES_INSTALLED = False
 
 
+from hub.constants import CLOUD_DEFAULT_MAX_CHUNK_SIZE
 from hub.core.storage.provider import StorageProvider
 from hub.util.exceptions import (
     GCSDefaultCredsNotFoundError,
@@ -201,6 +202,8 @@ class GCloudCredentials:
 class GCSProvider(StorageProvider):
     """Provider class for using GC storage."""
 
+    max_chunk_size = CLOUD_DEFAULT_MAX_CHUNK_SIZE
+
     def __init__(self, root: str, token: Union[str, Dict] = None, project: str = None):
         """Initializes the GCSProvider
 
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from collections.abc import MutableMapping
 from typing import Optional, Set, Sequence
 
-from hub.constants import BYTE_PADDING
+from hub.constants import BYTE_PADDING, DEFAULT_MAX_CHUNK_SIZE
 from hub.util.assert_byte_indexes import assert_byte_indexes
 from hub.util.exceptions import ReadOnlyModeError
 from hub.util.keys import get_dataset_lock_key
@@ -14,6 +14,10 @@ class StorageProvider(ABC, MutableMapping):
     root = ""
     _is_hub_path = False
 
+    # default max chunk size for tensors backed by this provider.
+    # cloud providers override this with a larger value to amortize per-request latency.
+    max_chunk_size = DEFAULT_MAX_CHUNK_SIZE
+
     """An abstract base class for implementing a storage provider.
 
     To add a new provider using Provider, create a subclass and implement all 5 abstract methods below.
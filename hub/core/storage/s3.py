@@ -8,6 +8,7 @@ import posixpath
 from typing import Dict, Optional
 from botocore.session import ComponentLocator
 from hub.client.client import HubBackendClient
+from hub.constants import CLOUD_DEFAULT_MAX_CHUNK_SIZE
 from hub.core.storage.provider import StorageProvider
 from hub.util.exceptions import (
     S3DeletionError,
@@ -79,6 +80,8 @@ class S3ResetClientManager:
 class S3Provider(StorageProvider):
     """Provider class for using S3 storage."""
 
+    max_chunk_size = CLOUD_DEFAULT_MAX_CHUNK_SIZE
+
     def __init__(
         self,
         root: str,
